@@ -1,10 +1,29 @@
 from __future__ import annotations
 
 import argparse
+import os
+import sys
 
-from bank_csv_normalizer.convert import convert
+from bank_csv_normalizer.convert import convert, write_outputs
 from bank_csv_normalizer.normalize.io import load_csv, load_excel
 from bank_csv_normalizer.detect import detect_profile
+from bank_csv_normalizer.profiling import profile_run
+from bank_csv_normalizer.transport import convert_paths
+from bank_csv_normalizer.watch import Watcher, output_paths
+
+
+def _add_profile_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--profile-out",
+        required=False,
+        help="Write a cProfile dump here, plus <path>.json with call counts and slow-path hits",
+    )
+    p.add_argument(
+        "--profile-sample",
+        type=float,
+        default=1.0,
+        help="Fraction of runs to profile when --profile-out is set (default: 1.0)",
+    )
 
 
 def main(argv=None) -> int:
@@ -13,17 +32,52 @@ def main(argv=None) -> int:
 
     p_detect = sub.add_parser("detect", help="Detect which bank profile matches the CSV")
     p_detect.add_argument("input", help="Path to input CSV")
+    _add_profile_args(p_detect)
 
     p_convert = sub.add_parser("convert", help="Convert bank CSV to canonical import format")
     p_convert.add_argument("input", help="Path to input CSV")
     p_convert.add_argument("--out", required=True, help="Path to output canonical CSV")
     p_convert.add_argument("--report", required=False, help="Path to output JSON report")
+    p_convert.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="Keep the canonical frame in compact dtypes (categorical/datetime64/int64) until export",
+    )
+
+    p_convert.add_argument(
+        "--total-marker",
+        action="append",
+        default=[],
+        help="Extra description marker for total/footer rows (repeatable)",
+    )
+    _add_profile_args(p_convert)
+
+    p_watch = sub.add_parser("watch", help="Convert new/changed exports dropped into a directory")
+    p_watch.add_argument("input_dir", help="Directory to watch for CSV/Excel exports")
+    p_watch.add_argument("--out-dir", required=True, help="Directory for canonical CSVs, reports and the index")
+    p_watch.add_argument("--interval", type=float, default=2.0, help="Seconds between polls")
+    p_watch.add_argument("--settle", type=float, default=2.0, help="Seconds a file must be unmodified before conversion")
+    p_watch.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    p_watch.add_argument("--low-memory", action="store_true", help="Same as convert --low-memory")
+    p_watch.add_argument("--total-marker", action="append", default=[], help="Same as convert --total-marker")
+    p_watch.add_argument("--once", action="store_true", help="Process what is ready now and exit")
+
+    p_batch = sub.add_parser(
+        "batch",
+        help="Convert several exports in parallel (requires pyarrow for the shared-memory transport)",
+    )
+    p_batch.add_argument("inputs", nargs="+", help="Paths to input CSV/Excel files")
+    p_batch.add_argument("--out-dir", required=True, help="Directory for canonical CSVs and reports")
+    p_batch.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    p_batch.add_argument("--low-memory", action="store_true", help="Same as convert --low-memory")
+    p_batch.add_argument("--total-marker", action="append", default=[], help="Same as convert --total-marker")
 
     args = parser.parse_args(argv)
 
     if args.cmd == "detect":
-        lr = load_csv(args.input)
-        m = detect_profile(lr.df)
+        with profile_run(args.profile_out, args.profile_sample):
+            lr = load_csv(args.input)
+            m = detect_profile(lr.df)
         print(f"profile={m.name} confidence={m.confidence:.2f}")
         if m.reasons:
             print("reasons:")
@@ -32,10 +86,67 @@ def main(argv=None) -> int:
         return 0
 
     if args.cmd == "convert":
-        rep = convert(args.input, args.out, args.report)
+        with profile_run(args.profile_out, args.profile_sample):
+            rep = convert(
+                args.input,
+                args.out,
+                args.report,
+                low_memory=args.low_memory,
+                extra_total_markers=args.total_marker,
+            )
         print(rep.to_json())
         return 0
 
+    if args.cmd == "watch":
+        def on_result(name, state):
+            line = f"{name}: {state.status}"
+            print(f"{line} ({state.error})" if state.error else line, flush=True)
+
+        watcher = Watcher(
+            args.input_dir,
+            args.out_dir,
+            interval=args.interval,
+            settle=args.settle,
+            workers=args.workers,
+            low_memory=args.low_memory,
+            extra_total_markers=args.total_marker,
+            on_result=on_result,
+        )
+        try:
+            watcher.run(once=args.once)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    if args.cmd == "batch":
+        names = [os.path.basename(p) for p in args.inputs]
+        clashes = sorted({n for n in names if names.count(n) > 1})
+        if clashes:
+            p_batch.error(f"inputs share a file name, so their outputs would collide: {', '.join(clashes)}")
+
+        os.makedirs(args.out_dir, exist_ok=True)
+        failed = 0
+        results = convert_paths(
+            args.inputs,
+            workers=args.workers,
+            low_memory=args.low_memory,
+            extra_total_markers=args.total_marker,
+        )
+        # Each file is written as soon as it is converted
+        for res in results:
+            if res.error is None:
+                out_path, report_path = output_paths(args.out_dir, os.path.basename(res.path))
+                try:
+                    write_outputs(res.canonical, res.report, out_path, report_path)
+                except OSError as e:
+                    res.error = e
+            if res.error is not None:
+                failed += 1
+                print(f"{res.path}: failed ({type(res.error).__name__}: {res.error})", file=sys.stderr, flush=True)
+                continue
+            print(f"{res.path}: {res.report.rows_out} rows -> {out_path}", flush=True)
+        return 1 if failed else 0
+
     return 1
 
 
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import io
-from typing import Optional, List, Tuple
+from typing import Iterable, Optional, List, Tuple
 
+import numpy as np
 import pandas as pd
 
+from bank_csv_normalizer.normalize.amounts import AMOUNT_DECIMALS, AMOUNT_SCALE, format_minor_units
 from bank_csv_normalizer.normalize.io import load_csv, load_excel
 from bank_csv_normalizer.detect import detect_profile
+from bank_csv_normalizer.footer import FooterDetector, present_mask
 from bank_csv_normalizer.profiles import ALL_PROFILES
-from bank_csv_normalizer.report import ConversionReport
+from bank_csv_normalizer.report import AMOUNT_DECIMALS_COL, ConversionReport, SummaryAccumulator
 
 
 CANONICAL_COLS = ["account_number", "transaction_date", "description", "amount"]
@@ -21,10 +24,85 @@ def _get_profile_by_name(name: str):
     return None
 
 
-def convert_df(df: pd.DataFrame) -> Tuple[pd.DataFrame, ConversionReport]:
+def _clean_str(s: pd.Series) -> pd.Series:
+    return s.fillna("").astype(str).str.strip()
+
+
+def _compact_date(s: pd.Series) -> Optional[pd.Series]:
+    """
+    Date strings -> datetime64, or None when any non-empty value isn't an ISO
+    date (the caller keeps strings, so no row turns into a missing date).
+    """
+    present = s != ""
+    dates = pd.to_datetime(s.where(present), format="%Y-%m-%d", errors="coerce")
+    if (dates.isna() & present).any():
+        return None
+    return dates
+
+
+# Amounts that int64 minor units hold exactly: at most 2 decimals and few
+# enough digits that the float64 parse below is exact.
+_COMPACT_AMOUNT = rf"-?\d{{1,13}}(?:\.\d{{1,{AMOUNT_DECIMALS}}})?"
+
+
+def _compact_amount(s: pd.Series) -> Optional[Tuple[pd.Series, pd.Series]]:
+    """
+    Amount strings -> (int64 minor units, int8 decimals shown), or None when any
+    value can't be held exactly at ``AMOUNT_SCALE`` (the caller keeps strings).
+    Vectorized: only numeric temporaries, no per-row Python objects.
+    """
+    if not len(s):
+        # Arrow-backed .str methods fail on an empty series of unknown type
+        return pd.Series(dtype="int64", index=s.index), pd.Series(dtype="int8", index=s.index)
+    if not s.str.fullmatch(_COMPACT_AMOUNT).all():
+        return None
+    minor = pd.Series(np.rint(pd.to_numeric(s).to_numpy() * AMOUNT_SCALE), index=s.index).astype("int64")
+    if ((minor == 0) & s.str.startswith("-")).any():
+        # "-0.00" would lose its sign
+        return None
+    dot = s.str.find(".")
+    decimals = (s.str.len() - dot - 1).where(dot >= 0, 0).astype("int8")
+    return minor, decimals
+
+
+def canonical_to_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Render a canonical dataframe with the string representation used for export.
+    String frames pass through unchanged; low-memory frames are formatted here
+    and render to the same text as the string frame would.
+    """
+    out = {}
+    for col in CANONICAL_COLS:
+        s = df[col]
+        if col == "transaction_date" and pd.api.types.is_datetime64_any_dtype(s):
+            s = s.dt.strftime("%Y-%m-%d").fillna("")
+        elif col == "amount" and pd.api.types.is_integer_dtype(s):
+            s = format_minor_units(s, df.get(AMOUNT_DECIMALS_COL))
+        elif isinstance(s.dtype, pd.CategoricalDtype):
+            s = s.astype(str)
+        out[col] = s
+    return pd.DataFrame(out, index=df.index)
+
+
+def convert_df(
+    df: pd.DataFrame,
+    low_memory: bool = False,
+    extra_total_markers: Iterable[str] = (),
+) -> Tuple[pd.DataFrame, ConversionReport]:
     """
     Core conversion from a parsed bank dataframe -> canonical dataframe + report.
     Works for both CLI and web uploads.
+
+    With ``low_memory=True`` the returned frame keeps account_number/description
+    as categoricals, transaction_date as datetime64 and amount as int64 minor
+    units (see ``AMOUNT_SCALE``) plus an int8 ``amount_decimals`` column used to
+    render each amount as it was parsed. If any date isn't ISO, or any amount
+    has more than 2 decimals, that column stays text (with a warning), so the
+    exported CSV is the same in both modes. Use ``canonical_to_strings`` to
+    render it.
+
+    ``extra_total_markers`` extends the footer marker set (on top of the
+    defaults and the profile's own ``total_markers``).
     """
     match = detect_profile(df)
     profile = _get_profile_by_name(match.name)
@@ -33,31 +111,77 @@ def convert_df(df: pd.DataFrame) -> Tuple[pd.DataFrame, ConversionReport]:
     if profile is None:
         raise ValueError(f"No profile found for detected name '{match.name}'. Reasons: {match.reasons}")
 
-    canonical = profile.extract_canonical(df)
     rows_in = len(df)
 
-    canonical = canonical[CANONICAL_COLS].copy()
-    canonical["account_number"] = canonical["account_number"].fillna("").astype(str).str.strip()
-    canonical["description"] = canonical["description"].fillna("").astype(str).str.strip()
-    canonical["transaction_date"] = canonical["transaction_date"].fillna("").astype(str).str.strip()
-    canonical["amount"] = canonical["amount"].fillna("").astype(str).str.strip()
+    # Profiles yield one column at a time; in low-memory mode each is compacted
+    # before the next is built, so only one column exists in string form.
+    # amount stays text until the masks are known (see _compact_amount).
+    canonical: Optional[pd.DataFrame] = None
+    amount = pd.Series(dtype=str)
+    for col, s in profile.iter_canonical(df):
+        if col not in CANONICAL_COLS:
+            continue
+        s = _clean_str(s)
+        if col == "amount":
+            amount = s
+            continue
+        if canonical is None:
+            canonical = pd.DataFrame(index=s.index)
+        if low_memory and col == "transaction_date":
+            dates = _compact_date(s)
+            if dates is None:
+                warnings.append("Kept dates as text: some values are not ISO dates.")
+            else:
+                s = dates
+        elif low_memory:
+            s = s.astype("category")
+        canonical[col] = s
+        del s
 
-    total_markers = ["סה\"כ", "סה״כ", "TOTAL", "Total", "סך הכל"]
-    mask_total = canonical["description"].apply(lambda x: any(m in x for m in total_markers))
-    if mask_total.any():
-        warnings.append(f"Removed {int(mask_total.sum())} total/footer rows by marker match.")
-        canonical = canonical[~mask_total]
+    detector = FooterDetector(extra_markers=list(profile.total_markers) + list(extra_total_markers))
+    mask_marker, mask_trailing = detector.masks(canonical)
+    mask_total = mask_marker | mask_trailing
+    if mask_marker.any():
+        warnings.append(f"Removed {int(mask_marker.sum())} total/footer rows by marker match.")
+    if mask_trailing.any():
+        warnings.append(f"Removed {int(mask_trailing.sum())} trailing rows after the last dated row.")
 
-    # account_number is optional — a profile may not have per-row account info
+    # account_number is optional — a profile may not have per-row account info.
     required_mask = (
-        (canonical["transaction_date"] != "")
-        & (canonical["description"] != "")
-        & (canonical["amount"] != "")
+        present_mask(canonical["transaction_date"])
+        & present_mask(canonical["description"])
+        & (amount != "")
     )
-    dropped = int((~required_mask).sum())
+    dropped = int((~required_mask & ~mask_total).sum())
     if dropped:
         warnings.append(f"Dropped {dropped} rows missing required canonical fields after parsing.")
-    canonical = canonical[required_mask]
+
+    summary = SummaryAccumulator()
+    # Only marker rows state totals; trailing undated rows are just leftovers
+    summary.add_footer(canonical[mask_marker].assign(amount=amount[mask_marker]))
+
+    # Single filter pass for both footer rows and incomplete rows
+    keep = required_mask & ~mask_total
+    canonical = canonical[keep]
+    amount = amount[keep]
+    compact = _compact_amount(amount) if low_memory else None
+    if compact is not None:
+        canonical = canonical.assign(**{"amount": compact[0], AMOUNT_DECIMALS_COL: compact[1]})
+        canonical = canonical[CANONICAL_COLS + [AMOUNT_DECIMALS_COL]]
+    else:
+        if low_memory:
+            warnings.append("Kept amounts as text: some values can't be stored exactly in minor units.")
+        canonical = canonical.assign(amount=amount)[CANONICAL_COLS]
+    del amount, compact
+    summary.update(canonical)
+
+    footer_totals = summary.reconcile()
+    for ft in footer_totals:
+        if not ft.matches:
+            warnings.append(
+                f"Footer total '{ft.description}' states {ft.stated} but converted rows sum to "
+                f"{ft.computed}" + (f" for account {ft.account_number}." if ft.account_number else ".")
+            )
 
     rep = ConversionReport(
         profile=match.name,
@@ -66,8 +190,10 @@ def convert_df(df: pd.DataFrame) -> Tuple[pd.DataFrame, ConversionReport]:
         rows_out=len(canonical),
         dropped_rows=(rows_in - len(canonical)) if rows_in >= len(canonical) else dropped,
         warnings=warnings + match.reasons,
+        accounts=summary.accounts(),
+        footer_totals=footer_totals,
     )
-    return canonical[CANONICAL_COLS], rep
+    return canonical, rep
 
 
 def canonical_to_csv_bytes(df: pd.DataFrame, encoding: str = "utf-8-sig") -> bytes:
@@ -76,25 +202,55 @@ def canonical_to_csv_bytes(df: pd.DataFrame, encoding: str = "utf-8-sig") -> byt
     Default utf-8-sig is best for Hebrew + Excel compatibility.
     """
     buf = io.StringIO()
-    df.to_csv(buf, index=False)
+    canonical_to_strings(df).to_csv(buf, index=False)
     return buf.getvalue().encode(encoding)
 
 
-def convert(input_path: str, output_path: str, report_path: Optional[str] = None) -> ConversionReport:
+def _write_canonical_csv(df: pd.DataFrame, path: str, encoding: str, chunk_rows: int = 100_000) -> None:
     """
-    CLI-friendly API: reads a CSV or Excel file from disk and writes canonical CSV to disk.
+    Write canonical CSV, rendering low-memory columns one slice at a time so the
+    string form of the whole frame never exists at once.
     """
-    if input_path.lower().endswith((".xlsx", ".xls")):
-        load_res = load_excel(input_path)
-    else:
-        load_res = load_csv(input_path)
-    canonical, rep = convert_df(load_res.df)
+    if len(df) <= chunk_rows:
+        canonical_to_strings(df).to_csv(path, index=False, encoding=encoding)
+        return
+    with open(path, "w", encoding=encoding, newline="") as f:
+        for start in range(0, len(df), chunk_rows):
+            part = canonical_to_strings(df.iloc[start:start + chunk_rows])
+            part.to_csv(f, index=False, header=(start == 0))
+
 
+def write_outputs(
+    canonical: pd.DataFrame,
+    rep: ConversionReport,
+    output_path: str,
+    report_path: Optional[str] = None,
+) -> None:
+    """Write a ``convert_df`` result: canonical CSV and, optionally, the JSON report."""
     # Use utf-8-sig to be safest for uploads/downloads
-    canonical.to_csv(output_path, index=False, encoding="utf-8-sig")
+    _write_canonical_csv(canonical, output_path, encoding="utf-8-sig")
 
     if report_path:
         with open(report_path, "w", encoding="utf-8") as f:
             f.write(rep.to_json())
 
+
+def convert(
+    input_path: str,
+    output_path: str,
+    report_path: Optional[str] = None,
+    low_memory: bool = False,
+    extra_total_markers: Iterable[str] = (),
+) -> ConversionReport:
+    """
+    CLI-friendly API: reads a CSV or Excel file from disk and writes canonical CSV to disk.
+    """
+    if input_path.lower().endswith((".xlsx", ".xls")):
+        load_res = load_excel(input_path)
+    else:
+        load_res = load_csv(input_path)
+    canonical, rep = convert_df(
+        load_res.df, low_memory=low_memory, extra_total_markers=extra_total_markers
+    )
+    write_outputs(canonical, rep, output_path, report_path)
     return rep
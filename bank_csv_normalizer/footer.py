@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Optional, Tuple
+
+import pandas as pd
+
+
+# Base markers shared by all profiles; profiles add their own via
+# ``BaseProfile.total_markers`` and callers via ``extra_markers``.
+DEFAULT_TOTAL_MARKERS = ["סה\"כ", "סה״כ", "TOTAL", "Total", "סך הכל"]
+
+# Hebrew abbreviations are typed with any of these between the letters
+# (ASCII quote, gershayim, geresh, apostrophe, doubled geresh, or nothing at all).
+_HEB_QUOTES = "[\"״׳'`]{0,2}"
+
+
+def _marker_regex(marker: str) -> str:
+    m = marker.strip()
+    if m in ("סה\"כ", "סה״כ"):
+        return "סה" + _HEB_QUOTES + "כ"
+    # Allow any run of whitespace where the marker has a space ("סך  הכל")
+    pattern = r"\s+".join(re.escape(part) for part in m.split())
+    if m.isascii():
+        # Whole words only, so "Subtotal bistro" and "TotalEnergies" stay
+        if m[0].isalnum():
+            pattern = r"\b" + pattern
+        if m[-1].isalnum():
+            pattern += r"\b"
+    return pattern
+
+
+def compile_markers(markers: Iterable[str]) -> re.Pattern:
+    """
+    Compile a marker set into a single alternation, so footer detection is one
+    regex scan per row instead of one substring test per marker. Matching is
+    case-sensitive, like the marker list itself.
+    """
+    parts = sorted({_marker_regex(m) for m in markers if m and m.strip()}, key=len, reverse=True)
+    if not parts:
+        # Matches nothing
+        return re.compile(r"(?!x)x")
+    return re.compile("|".join(parts))
+
+
+def present_mask(s: pd.Series) -> pd.Series:
+    """Non-empty cells of a canonical column, in string or low-memory form."""
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s.notna()
+    return (s != "") & s.notna()
+
+
+@dataclass
+class FooterSplit:
+    kept: pd.DataFrame
+    footer: pd.DataFrame
+    by_marker: int
+    by_position: int
+
+
+class FooterDetector:
+    """
+    Finds total/footer rows in a canonical string frame (see ``CANONICAL_COLS``).
+
+    Two signals are used:
+      - marker match: description matches the compiled marker set
+      - position: rows after the last dated row (the trailing empty/total block)
+
+    ``masks`` works on a whole frame and is what ``convert_df`` uses. ``feed``/
+    ``finish`` give the same answer chunk by chunk: only the current trailing
+    undated run is held back, since a later dated row would turn it back into
+    ordinary rows. They are a building block for a chunked reader; no
+    conversion path streams through them yet, as loading still reads the whole
+    file into one frame.
+    """
+
+    def __init__(self, markers: Optional[Iterable[str]] = None, extra_markers: Iterable[str] = ()):
+        base = list(DEFAULT_TOTAL_MARKERS if markers is None else markers)
+        self.pattern = compile_markers(base + list(extra_markers))
+        self._pending: Optional[pd.DataFrame] = None
+
+    def marker_mask(self, description: pd.Series) -> pd.Series:
+        if not len(description):
+            # Empty chunks may not carry a string dtype
+            return pd.Series(False, index=description.index, dtype=bool)
+        if isinstance(description.dtype, pd.CategoricalDtype):
+            # Match each distinct description once, then broadcast by code
+            cats = description.cat.categories.to_series().astype(str)
+            hit = cats.str.contains(self.pattern, na=False).to_numpy()
+            codes = description.cat.codes.to_numpy()
+            return pd.Series((codes >= 0) & hit[codes], index=description.index)
+        return description.str.contains(self.pattern, na=False)
+
+    @staticmethod
+    def _trailing_start(dates: pd.Series) -> int:
+        """Position of the first row after the last dated row."""
+        dated = present_mask(dates).to_numpy().nonzero()[0]
+        return int(dated[-1]) + 1 if len(dated) else 0
+
+    def masks(self, canonical: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
+        """Return (marker_mask, trailing_mask) for a complete frame."""
+        by_marker = self.marker_mask(canonical["description"])
+        start = self._trailing_start(canonical["transaction_date"])
+        trailing = pd.Series(False, index=canonical.index)
+        trailing.iloc[start:] = True
+        return by_marker, trailing & ~by_marker
+
+    def feed(self, chunk: pd.DataFrame) -> FooterSplit:
+        if self._pending is not None and len(self._pending):
+            chunk = pd.concat([self._pending, chunk])
+        start = self._trailing_start(chunk["transaction_date"])
+        self._pending = chunk.iloc[start:]
+        body = chunk.iloc[:start]
+        by_marker = self.marker_mask(body["description"])
+        return FooterSplit(
+            kept=body[~by_marker],
+            footer=body[by_marker],
+            by_marker=int(by_marker.sum()),
+            by_position=0,
+        )
+
+    def finish(self) -> FooterSplit:
+        tail = self._pending if self._pending is not None else pd.DataFrame()
+        self._pending = None
+        n_marker = int(self.marker_mask(tail["description"]).sum()) if len(tail) else 0
+        return FooterSplit(
+            kept=tail.iloc[:0],
+            footer=tail,
+            by_marker=n_marker,
+            by_position=len(tail) - n_marker,
+        )
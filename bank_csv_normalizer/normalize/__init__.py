@@ -1,14 +1,20 @@
-from .io import load_csv, load_excel, LoadResult
+from .io import load_csv, load_csv_bytes, load_excel, load_bytes, LoadResult
 from .dates import parse_date_to_iso
-from .amounts import parse_amount
+from .amounts import parse_amount, amount_to_text, format_minor_units, AMOUNT_DECIMALS, AMOUNT_SCALE
 from .text import clean_description, clean_header
 
 __all__ = [
     "load_csv",
+    "load_csv_bytes",
     "load_excel",
+    "load_bytes",
     "LoadResult",
     "parse_date_to_iso",
     "parse_amount",
+    "amount_to_text",
+    "format_minor_units",
+    "AMOUNT_DECIMALS",
+    "AMOUNT_SCALE",
     "clean_description",
     "clean_header",
 ]
\ No newline at end of file
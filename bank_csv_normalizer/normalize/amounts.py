@@ -3,6 +3,14 @@ from __future__ import annotations
 from decimal import Decimal, InvalidOperation
 from typing import Optional
 
+import pandas as pd
+
+from bank_csv_normalizer.profiling import record_slow_path
+
+# Amounts held as int64 are stored in minor units (agorot / cents).
+AMOUNT_DECIMALS = 2
+AMOUNT_SCALE = 10 ** AMOUNT_DECIMALS
+
 
 def _strip_currency_and_spaces(s: str) -> str:
     return (
@@ -54,4 +62,29 @@ def parse_amount(value: str) -> Optional[Decimal]:
             amt = -amt
         return amt
     except (InvalidOperation, ValueError):
+        record_slow_path("amounts.unparsed", value)
         return None
+
+
+def amount_to_text(value: str) -> str:
+    """``parse_amount`` rendered as the canonical amount string ("" when unparsable)."""
+    amt = parse_amount(value)
+    return "" if amt is None else str(amt)
+
+
+def format_minor_units(s: pd.Series, decimals: Optional[pd.Series] = None) -> pd.Series:
+    """
+    Vectorized int64 minor units -> strings like "-1200.50". With ``decimals``
+    (per-row 0..2) the fraction is cut back so "100" and "10.5" render as parsed.
+    """
+    a = s.abs()
+    whole = (a // AMOUNT_SCALE).astype(str)
+    frac = (a % AMOUNT_SCALE).astype(str).str.zfill(AMOUNT_DECIMALS)
+    if decimals is None:
+        out = whole + "." + frac
+    else:
+        out = whole.copy()
+        for n in range(1, AMOUNT_DECIMALS + 1):
+            sel = decimals == n
+            out[sel] = whole[sel] + "." + frac[sel].str[:n]
+    return out.where(s >= 0, "-" + out)
@@ -3,6 +3,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
+from bank_csv_normalizer.profiling import record_slow_path
+
 DATE_FORMATS = [
     "%d.%m.%Y",
     "%d/%m/%Y",
@@ -11,6 +13,9 @@ DATE_FORMATS = [
     "%d-%m-%Y",
 ]
 
+# Slow-path counter names, built once rather than per parsed cell
+_FORMAT_SLOW_PATHS = [f"dates.format[{fmt}]" for fmt in DATE_FORMATS]
+
 
 def parse_date_to_iso(value: str) -> Optional[str]:
     v = (value or "").strip()
@@ -20,14 +25,18 @@ def parse_date_to_iso(value: str) -> Optional[str]:
     # Sometimes includes time; keep only date part
     v = v.split()[0]
 
-    for fmt in DATE_FORMATS:
+    for i, fmt in enumerate(DATE_FORMATS):
         try:
             dt = datetime.strptime(v, fmt)
+            if i:
+                # Each earlier format raised first
+                record_slow_path(_FORMAT_SLOW_PATHS[i])
             return dt.strftime("%Y-%m-%d")
         except ValueError:
             continue
 
     # last resort: "1.9.2025"
+    record_slow_path("dates.fallback", v)
     if "." in v:
         parts = v.split(".")
         if len(parts) == 3:
@@ -38,4 +47,5 @@ def parse_date_to_iso(value: str) -> Optional[str]:
             except Exception:
                 pass
 
+    record_slow_path("dates.unparsed", v)
     return None
@@ -7,6 +7,8 @@ from typing import Tuple
 
 import pandas as pd
 
+from bank_csv_normalizer.profiling import record_slow_path
+
 
 @dataclass
 class LoadResult:
@@ -107,9 +109,12 @@ def _find_header_row(text: str, delimiter: str, min_columns: int = 4) -> int:
 
         base_score = kw_hits * 10 + len(nonempty)
 
+        record_slow_path("header.lookahead_candidates")
         date_hits = 0
         amt_hits = 0
+        scanned = 0
         for j in range(i + 1, min(i + 41, max_scan)):
+            scanned += 1
             for c in rows[j]:
                 if date_hits < 30 and is_date_like(c):
                     date_hits += 1
@@ -117,6 +122,7 @@ def _find_header_row(text: str, delimiter: str, min_columns: int = 4) -> int:
                     amt_hits += 1
             if date_hits >= 10 and amt_hits >= 10:
                 break
+        record_slow_path("header.lookahead_rows", count=scanned)
 
         score = base_score + date_hits * 2 + amt_hits
 
@@ -136,7 +142,7 @@ _EXCEL_HEADER_KEYWORDS = [
 ]
 
 
-def _find_excel_header_row(path: str, sheet: int = 0, max_scan: int = 30) -> int:
+def _find_excel_header_row(path, sheet: int = 0, max_scan: int = 30) -> int:
     """
     Scan the first ``max_scan`` rows of an Excel sheet (reading without a
     header) and return the 0-indexed row that looks most like a header.
@@ -162,10 +168,11 @@ def _find_excel_header_row(path: str, sheet: int = 0, max_scan: int = 30) -> int
     return best_idx
 
 
-def load_excel(path: str, sheet: int = 0, header_row: int | None = None) -> LoadResult:
+def load_excel(path, sheet: int = 0, header_row: int | None = None) -> LoadResult:
     """
     Load a bank Excel export (.xlsx / .xls) into a LoadResult.
 
+    ``path`` may also be the raw file bytes.
     ``header_row`` (0-indexed) is the row that contains column names.
     If ``None`` (default), the header row is auto-detected by scanning for
     bank-domain keywords.
@@ -177,11 +184,15 @@ def load_excel(path: str, sheet: int = 0, header_row: int | None = None) -> Load
       - header_row_index : the row index used as header
       - raw_text_preview : first 20 rows as repr string
     """
+    def source():
+        # A fresh buffer per read: pandas consumes file-like objects
+        return io.BytesIO(path) if isinstance(path, (bytes, bytearray)) else path
+
     if header_row is None:
-        header_row = _find_excel_header_row(path, sheet=sheet)
+        header_row = _find_excel_header_row(source(), sheet=sheet)
 
     df = pd.read_excel(
-        path,
+        source(),
         sheet_name=sheet,
         header=header_row,
         dtype=str,
@@ -205,7 +216,10 @@ def load_excel(path: str, sheet: int = 0, header_row: int | None = None) -> Load
 def load_csv(path: str) -> LoadResult:
     with open(path, "rb") as f:
         data = f.read()
+    return load_csv_bytes(data)
+
 
+def load_csv_bytes(data: bytes) -> LoadResult:
     text, encoding = _decode_bytes(data)
     delimiter = _sniff_delimiter(text)
     header_row_index = _find_header_row(text, delimiter=delimiter, min_columns=4)
@@ -229,3 +243,10 @@ def load_csv(path: str) -> LoadResult:
         header_row_index=header_row_index,
         raw_text_preview=preview,
     )
+
+
+def load_bytes(data: bytes, filename: str) -> LoadResult:
+    """Load raw export bytes, choosing the CSV or Excel loader by file name."""
+    if filename.lower().endswith((".xlsx", ".xls")):
+        return load_excel(data)
+    return load_csv_bytes(data)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import Iterator, List, Tuple
 
 import pandas as pd
 
@@ -16,6 +16,8 @@ class ProfileMatch:
 class BaseProfile:
     name: str = "base"
     header_signatures: List[List[str]] = []
+    # Extra footer markers for this layout, on top of footer.DEFAULT_TOTAL_MARKERS
+    total_markers: List[str] = []
 
     def match(self, df: pd.DataFrame) -> ProfileMatch:
         cols = [str(c).strip() for c in df.columns]
@@ -36,5 +38,15 @@ class BaseProfile:
 
         return ProfileMatch(name=self.name, confidence=best, reasons=best_reasons)
 
+    def iter_canonical(self, df: pd.DataFrame) -> Iterator[Tuple[str, pd.Series]]:
+        """
+        Yield canonical columns one at a time, in canonical order, so callers
+        can compact each column before the next is built.
+        Profiles that only implement ``extract_canonical`` get this for free.
+        """
+        out = self.extract_canonical(df)
+        for col in out.columns:
+            yield col, out[col]
+
     def extract_canonical(self, df: pd.DataFrame) -> pd.DataFrame:
         raise NotImplementedError
@@ -75,6 +75,9 @@ class DiscountBankVisaV1(BaseProfile):
     # extract_canonical                                                    #
     # ------------------------------------------------------------------ #
     def extract_canonical(self, df: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame(dict(self.iter_canonical(df)))
+
+    def iter_canonical(self, df: pd.DataFrame):
         # Normalise column names once so we can look them up safely
         df = df.copy()
         df.columns = [str(c).replace("\n", " ").strip() for c in df.columns]
@@ -86,27 +89,17 @@ class DiscountBankVisaV1(BaseProfile):
                 return df.iloc[:, fallback_idx].astype(str)
             return pd.Series([""] * len(df))
 
-        date_raw = _col("תאריך עסקה", 0).fillna("").astype(str)
-        desc_raw = _col("שם בית עסק", 1).fillna("").astype(str)
-        amt_raw = _col("סכום חיוב", 3).fillna("").astype(str)   # charged amount (ILS)
-
-        # account_number: not a per-row column in this format.
-        # Left empty — account_number is optional in the canonical schema.
-        account = pd.Series([""] * len(df))
-
         def _parse_date(val: str) -> str:
             # pandas read_excel already parses dates as Timestamp strings like
             # "2025-11-30 00:00:00"; strip the time part first.
             val = val.split(" ")[0].strip()
             return parse_date_to_iso(val)
 
-        out = pd.DataFrame(
-            {
-                "account_number": account,
-                "transaction_date": date_raw.map(_parse_date),
-                "description": desc_raw.map(clean_description),
-                "amount": amt_raw.map(lambda x: str(parse_amount(x) or "")),
-            }
-        )
-
-        return out
+        # account_number: not a per-row column in this format.
+        # Left empty — account_number is optional in the canonical schema.
+        # Columns are built one at a time; see BaseProfile.iter_canonical
+        yield "account_number", pd.Series([""] * len(df))
+        yield "transaction_date", _col("תאריך עסקה", 0).fillna("").astype(str).map(_parse_date)
+        yield "description", _col("שם בית עסק", 1).fillna("").astype(str).map(clean_description)
+        # charged amount (ILS)
+        yield "amount", _col("סכום חיוב", 3).fillna("").astype(str).map(lambda x: str(parse_amount(x) or ""))
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pandas as pd
 
-from bank_csv_normalizer.normalize.amounts import parse_amount
+from bank_csv_normalizer.normalize.amounts import amount_to_text
 from bank_csv_normalizer.normalize.dates import parse_date_to_iso
 from bank_csv_normalizer.normalize.text import clean_description
 from bank_csv_normalizer.profiles.base import BaseProfile
@@ -23,39 +23,35 @@ class IsraeliCardsAggregateV1(BaseProfile):
     ]
 
     def extract_canonical(self, df: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame(dict(self.iter_canonical(df)))
+
+    def iter_canonical(self, df: pd.DataFrame):
         def col(name: str) -> pd.Series:
             if name in df.columns:
                 return df[name].astype(str)
             return pd.Series([""] * len(df), dtype=str)
 
-        account = col("כרטיס")
-
-        merchant = col("בית עסק")
-        details = col("פירוט")
+        # Columns are built one at a time; see BaseProfile.iter_canonical
+        yield "account_number", col("כרטיס").fillna("").astype(str).str.strip()
 
         # Prefer transaction date; fallback to billing date
         date_raw = col("תאריך עסקה")
         if date_raw.eq("").all():
             date_raw = col("תאריך החיוב")
+        yield "transaction_date", date_raw.fillna("").astype(str).map(parse_date_to_iso)
+        del date_raw
+
+        # Description: merchant + optional details
+        desc = col("בית עסק").fillna("").astype(str).str.strip()
+        det = col("פירוט").fillna("").astype(str).str.strip()
+        has_det = det != ""
+        desc[has_det] = desc[has_det] + " — " + det[has_det]
+        del det, has_det
+        yield "description", desc.map(clean_description)
+        del desc
 
         # Prefer billed amount; fallback to transaction amount
         amt_raw = col("סכום החיוב")
         if amt_raw.eq("").all():
             amt_raw = col("סכום העסקה")
-
-        # Description: merchant + optional details
-        desc = merchant.fillna("").astype(str).str.strip()
-        det = details.fillna("").astype(str).str.strip()
-        desc = desc.where(det == "", desc + " — " + det)
-
-        out = pd.DataFrame(
-            {
-                "account_number": account.fillna("").astype(str).str.strip(),
-                "transaction_date": date_raw.fillna("").astype(str).map(parse_date_to_iso),
-                "description": desc.map(clean_description),
-                "amount": amt_raw.fillna("").astype(str).map(parse_amount),
-            }
-        )
-
-        out["amount"] = out["amount"].map(lambda d: "" if d is None else str(d))
-        return out
+        yield "amount", amt_raw.fillna("").astype(str).map(amount_to_text)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import pandas as pd
 
 from bank_csv_normalizer.normalize.dates import parse_date_to_iso
-from bank_csv_normalizer.normalize.amounts import parse_amount
+from bank_csv_normalizer.normalize.amounts import amount_to_text
 from bank_csv_normalizer.normalize.text import clean_description
 from bank_csv_normalizer.profiles.base import BaseProfile
 
@@ -19,6 +19,9 @@ class IsraeliCreditCardV1(BaseProfile):
     ]
 
     def extract_canonical(self, df: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame(dict(self.iter_canonical(df)))
+
+    def iter_canonical(self, df: pd.DataFrame):
         def pick(colname: str, fallback_idx: int):
             return (
                 df[colname]
@@ -26,19 +29,8 @@ class IsraeliCreditCardV1(BaseProfile):
                 else (df.iloc[:, fallback_idx] if len(df.columns) > fallback_idx else "")
             )
 
-        account = pick("שם כרטיס", 0).astype(str)
-        date_raw = pick("תאריך", 1).astype(str)
-        desc_raw = pick("שם בית עסק", 2).astype(str)
-        amt_raw = pick("סכום קנייה", 3).astype(str)
-
-        out = pd.DataFrame(
-            {
-                "account_number": account.map(lambda x: x.strip()),
-                "transaction_date": date_raw.map(parse_date_to_iso),
-                "description": desc_raw.map(clean_description),
-                "amount": amt_raw.map(lambda x: parse_amount(x)),
-            }
-        )
-
-        out["amount"] = out["amount"].map(lambda d: ("" if d is None else str(d)))
-        return out
+        # Columns are built one at a time; see BaseProfile.iter_canonical
+        yield "account_number", pick("שם כרטיס", 0).astype(str).map(lambda x: x.strip())
+        yield "transaction_date", pick("תאריך", 1).astype(str).map(parse_date_to_iso)
+        yield "description", pick("שם בית עסק", 2).astype(str).map(clean_description)
+        yield "amount", pick("סכום קנייה", 3).astype(str).map(amount_to_text)
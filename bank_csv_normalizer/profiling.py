@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import cProfile
+import json
+import os
+import pstats
+import random
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+# Slow-path counters are only collected inside ``profile_run``; outside of it
+# ``record_slow_path`` is a single global check.
+_counters: Optional[Counter] = None
+_samples: Optional[Dict[str, List[str]]] = None
+
+MAX_SAMPLES_PER_PATH = 5
+TOP_FUNCTIONS = 25
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def record_slow_path(name: str, value: Optional[str] = None, count: int = 1) -> None:
+    """Count a hit on a known slow branch, keeping a few example inputs."""
+    if _counters is None:
+        return
+    _counters[name] += count
+    if value is not None:
+        examples = _samples.setdefault(name, [])
+        if len(examples) < MAX_SAMPLES_PER_PATH:
+            examples.append(value)
+
+
+def _function_rows(stats: pstats.Stats) -> List[dict]:
+    rows = []
+    for (filename, line, func), (cc, nc, tt, ct, _callers) in stats.stats.items():
+        rows.append(
+            {
+                "function": func,
+                "location": f"{filename}:{line}",
+                "calls": nc,
+                "primitive_calls": cc,
+                "tottime": round(tt, 6),
+                "cumtime": round(ct, 6),
+                "package": os.path.abspath(filename).startswith(_PACKAGE_DIR),
+            }
+        )
+    return rows
+
+
+def _write_summary(prof: cProfile.Profile, path: str) -> None:
+    rows = _function_rows(pstats.Stats(prof))
+    summary = {
+        # Every function in this package, by call count
+        "package_functions": sorted(
+            (r for r in rows if r["package"]), key=lambda r: r["calls"], reverse=True
+        ),
+        # Hottest functions overall (pandas, re, strptime, ...)
+        "top_functions": sorted(rows, key=lambda r: r["tottime"], reverse=True)[:TOP_FUNCTIONS],
+        "slow_paths": dict(_counters.most_common()),
+        "slow_path_examples": _samples,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+@contextmanager
+def profile_run(out_path: Optional[str], sample_rate: float = 1.0) -> Iterator[bool]:
+    """
+    Profile the enclosed block when ``out_path`` is set and this run is sampled
+    (``random() < sample_rate``). Writes:
+      - ``out_path``         : cProfile dump (pstats / snakeviz / flameprof)
+      - ``out_path + .json`` : per-function call counts and slow-path hits
+    Yields whether profiling is active.
+    """
+    global _counters, _samples
+    if not out_path or random.random() >= sample_rate:
+        yield False
+        return
+
+    _counters, _samples = Counter(), {}
+    prof = cProfile.Profile()
+    prof.enable()
+    try:
+        yield True
+    finally:
+        prof.disable()
+        try:
+            prof.dump_stats(out_path)
+            _write_summary(prof, out_path + ".json")
+        finally:
+            _counters, _samples = None, None
@@ -1,9 +1,34 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import List
+from dataclasses import dataclass, asdict, field
+from decimal import MAX_PREC, Context, Decimal, InvalidOperation, localcontext
+from typing import Dict, List, Optional, Tuple
 import json
 
+import pandas as pd
+
+from bank_csv_normalizer.normalize.amounts import AMOUNT_DECIMALS
+
+# Low-memory frames only: decimals shown per amount (0-2), not exported
+AMOUNT_DECIMALS_COL = "amount_decimals"
+
+
+@dataclass
+class AccountSummary:
+    rows: int = 0
+    total: str = "0"
+    first_date: str = ""
+    last_date: str = ""
+
+
+@dataclass
+class FooterTotal:
+    account_number: str
+    description: str
+    stated: str
+    computed: str
+    matches: bool
+
 
 @dataclass
 class ConversionReport:
@@ -13,6 +38,126 @@ class ConversionReport:
     rows_out: int
     dropped_rows: int
     warnings: List[str]
+    accounts: Dict[str, AccountSummary] = field(default_factory=dict)
+    footer_totals: List[FooterTotal] = field(default_factory=list)
 
     def to_json(self) -> str:
         return json.dumps(asdict(self), ensure_ascii=False, indent=2)
+
+
+# Sums of exact decimals stay exact at this precision
+_EXACT = Context(prec=MAX_PREC)
+
+
+def _parse_exact(value) -> Optional[Decimal]:
+    """Canonical amount -> Decimal, or None for empty, unparsable or non-finite."""
+    try:
+        d = Decimal(str(value).strip())
+    except (InvalidOperation, ValueError):
+        return None
+    return d if d.is_finite() else None
+
+
+def _iso(v) -> str:
+    return v.strftime("%Y-%m-%d") if isinstance(v, pd.Timestamp) else str(v)
+
+
+def _group_totals(canonical: pd.DataFrame, accounts: pd.Series) -> Dict[str, Decimal]:
+    """Exact per-account sums, at the amounts' own scale."""
+    amount = canonical["amount"]
+    if pd.api.types.is_integer_dtype(amount):
+        # Low-memory frame: int64 minor units, exact; render at the largest
+        # number of decimals in the group, as summing the strings would.
+        decimals = canonical.get(AMOUNT_DECIMALS_COL, pd.Series(AMOUNT_DECIMALS, index=canonical.index))
+        agg = pd.DataFrame({"account": accounts, "minor": amount, "dec": decimals}).groupby(
+            "account", sort=False, observed=True
+        ).agg(minor=("minor", "sum"), dec=("dec", "max"))
+        return {
+            str(acc): Decimal(int(minor))
+            .scaleb(-AMOUNT_DECIMALS, _EXACT)
+            .quantize(Decimal(1).scaleb(-int(dec)), context=_EXACT)
+            for acc, minor, dec in agg.itertuples()
+        }
+    totals: Dict[str, Decimal] = {}
+    with localcontext(_EXACT):
+        for acc, d in zip(accounts.astype(str), amount.map(_parse_exact)):
+            if d is not None:
+                totals[acc] = totals.get(acc, Decimal(0)) + d
+    return totals
+
+
+class SummaryAccumulator:
+    """
+    Per-account row counts, exact totals and date ranges, updated one canonical
+    chunk at a time. Accepts both string and low-memory canonical frames.
+    Amounts that are not finite numbers are left out of the totals. Footer
+    rows are collected separately and reconciled against the computed totals
+    at the end.
+    """
+
+    def __init__(self):
+        self._rows: Dict[str, int] = {}
+        self._totals: Dict[str, Decimal] = {}
+        self._first: Dict[str, str] = {}
+        self._last: Dict[str, str] = {}
+        self._footers: List[Tuple[str, str, Decimal, str]] = []
+
+    def update(self, canonical: pd.DataFrame) -> None:
+        if not len(canonical):
+            return
+        # Group the columns as they are: categorical accounts and datetime64
+        # dates from low-memory frames are aggregated without string copies.
+        # ISO date strings compare chronologically, so min/max work for both.
+        accounts = canonical["account_number"]
+        agg = pd.DataFrame({"account": accounts, "date": canonical["transaction_date"]}).groupby(
+            "account", sort=False, observed=True
+        ).agg(rows=("date", "size"), first=("date", "min"), last=("date", "max"))
+        for acc, rows, first, last in agg.itertuples():
+            acc, first, last = str(acc), _iso(first), _iso(last)
+            self._rows[acc] = self._rows.get(acc, 0) + int(rows)
+            self._totals.setdefault(acc, Decimal(0))
+            self._first[acc] = min(self._first.get(acc, first), first)
+            self._last[acc] = max(self._last.get(acc, last), last)
+        with localcontext(_EXACT):
+            for acc, total in _group_totals(canonical, accounts).items():
+                self._totals[acc] += total
+
+    def add_footer(self, footer: pd.DataFrame) -> None:
+        """Keep footer rows that state a finite amount (string canonical frame)."""
+        for acc, desc, amt in zip(footer["account_number"], footer["description"], footer["amount"]):
+            stated = _parse_exact(amt)
+            if stated is not None:
+                self._footers.append((str(acc), str(desc), stated, str(amt).strip()))
+
+    def accounts(self) -> Dict[str, AccountSummary]:
+        return {
+            acc: AccountSummary(
+                rows=self._rows[acc],
+                total=str(self._totals[acc]),
+                first_date=self._first[acc],
+                last_date=self._last[acc],
+            )
+            for acc in self._rows
+        }
+
+    def reconcile(self) -> List[FooterTotal]:
+        """
+        Compare each stated footer total with the computed sum for its account
+        (0 for an account with no converted rows), or with the grand total
+        when the footer row has no account.
+        """
+        with localcontext(_EXACT):
+            grand = sum(self._totals.values(), Decimal(0))
+        out = []
+        for acc, desc, stated_value, stated in self._footers:
+            computed = self._totals.get(acc, Decimal(0)) if acc else grand
+            out.append(
+                FooterTotal(
+                    account_number=acc,
+                    description=desc,
+                    stated=stated,
+                    computed=str(computed),
+                    matches=stated_value == computed,
+                )
+            )
+        return out
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import pandas as pd
+
+
+# Israeli cards aggregate export, the profile most tests convert through
+AGG_HEADERS = ["כרטיס", "בית עסק", "תאריך עסקה", "סכום העסקה", "תאריך החיוב", "סכום החיוב"]
+
+
+def aggregate_df(rows) -> pd.DataFrame:
+    """Aggregate export frame from (card, merchant, date, amount) rows."""
+    return pd.DataFrame(
+        [[card, merchant, date, amount, "10/10/2025", amount] for card, merchant, date, amount in rows],
+        columns=AGG_HEADERS,
+        dtype=str,
+    )
+
+
+def aggregate_csv(rows) -> bytes:
+    """Same rows as an exported CSV file."""
+    return aggregate_df(rows).to_csv(index=False).encode("utf-8")
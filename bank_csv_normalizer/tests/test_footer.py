@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import random
+
+import pandas as pd
+
+from bank_csv_normalizer.footer import FooterDetector, compile_markers
+
+
+def _canonical(rows):
+    """(transaction_date, description) pairs -> canonical string frame."""
+    return pd.DataFrame(
+        {
+            "account_number": ["1234"] * len(rows),
+            "transaction_date": [d for d, _ in rows],
+            "description": [desc for _, desc in rows],
+            "amount": ["1"] * len(rows),
+        }
+    )
+
+
+def test_markers_match_quote_variants_and_whitespace():
+    pat = compile_markers(["סה\"כ", "סך הכל"])
+    for text in ["סה\"כ לחיוב", "סה״כ", "סה׳׳כ", "סהכ", "סך  הכל"]:
+        assert pat.search(text), text
+
+
+def test_latin_markers_are_whole_word_and_case_sensitive():
+    pat = FooterDetector().pattern
+    for text in ["TOTAL", "Total for card 1234", "Grand Total:"]:
+        assert pat.search(text), text
+    for text in ["totalenergies", "TotalEnergies", "Subtotal bistro", "Totally Coffee", "total"]:
+        assert not pat.search(text), text
+
+
+def test_masks_marker_and_trailing_block():
+    df = _canonical(
+        [
+            ("2025-09-01", "שופרסל"),
+            ("", "Pending"),
+            ("2025-09-02", "סה\"כ לכרטיס"),
+            ("", ""),
+            ("", "סך הכל"),
+            ("", "Pending auth - Cafe"),
+        ]
+    )
+    by_marker, trailing = FooterDetector().masks(df)
+    assert by_marker.tolist() == [False, False, True, False, True, False]
+    assert trailing.tolist() == [False, False, False, True, False, True]
+
+
+def test_marker_mask_categorical_matches_strings():
+    desc = pd.Series(["שופרסל", "סה\"כ", "", "Total", "Subtotal", "סה\"כ"])
+    det = FooterDetector()
+    assert det.marker_mask(desc.astype("category")).tolist() == det.marker_mask(desc).tolist()
+
+
+def test_feed_finish_agree_with_masks():
+    rng = random.Random(7)
+    descs = ["שופרסל", "פז", "סה\"כ", "Total", "", "Subtotal bistro"]
+    for _ in range(200):
+        n = rng.randint(0, 30)
+        rows = [(rng.choice(["2025-09-01", "", ""]), rng.choice(descs)) for _ in range(n)]
+        df = _canonical(rows)
+
+        by_marker, trailing = FooterDetector().masks(df)
+        expected_footer = set(df.index[by_marker | trailing])
+
+        det = FooterDetector()
+        kept, footer, n_marker, n_position = [], [], 0, 0
+        cuts = sorted(rng.sample(range(n + 1), k=min(3, n + 1)))
+        bounds = [0] + cuts + [n]
+        for start, stop in zip(bounds, bounds[1:]):
+            split = det.feed(df.iloc[start:stop])
+            kept.extend(split.kept.index)
+            footer.extend(split.footer.index)
+            n_marker += split.by_marker
+        tail = det.finish()
+        kept.extend(tail.kept.index)
+        footer.extend(tail.footer.index)
+        n_marker += tail.by_marker
+        n_position += tail.by_position
+
+        assert set(footer) == expected_footer
+        assert sorted(kept + footer) == list(df.index)
+        assert n_marker == int(by_marker.sum())
+        assert n_position == int(trailing.sum())
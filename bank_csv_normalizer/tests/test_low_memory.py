@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from bank_csv_normalizer.convert import CANONICAL_COLS, AMOUNT_DECIMALS_COL, canonical_to_csv_bytes, convert_df
+from bank_csv_normalizer.normalize.amounts import format_minor_units
+from bank_csv_normalizer.tests.helpers import aggregate_df
+
+
+def _both_modes(df):
+    out_str, rep_str = convert_df(df)
+    out_low, rep_low = convert_df(df, low_memory=True)
+    return out_str, rep_str, out_low, rep_low
+
+
+def test_low_memory_dtypes_and_identical_csv():
+    df = aggregate_df(
+        [
+            ("1234", "שופרסל", "01/09/2025", "100"),
+            ("1234", "רמי לוי", "02/09/2025", "10.5"),
+            ("5678", "פז", "03/09/2025", "-12.50"),
+            ("5678", "שופרסל", "04/09/2025", "1,200.00"),
+            ("5678", "קפה", "05/09/2025", "0.10"),
+        ]
+    )
+    out_str, _, out_low, rep_low = _both_modes(df)
+
+    assert isinstance(out_low["account_number"].dtype, pd.CategoricalDtype)
+    assert isinstance(out_low["description"].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_datetime64_any_dtype(out_low["transaction_date"])
+    assert out_low["amount"].dtype == "int64"
+    assert out_low["amount"].tolist() == [10000, 1050, -1250, 120000, 10]
+    assert out_low[AMOUNT_DECIMALS_COL].tolist() == [0, 1, 2, 2, 2]
+
+    assert canonical_to_csv_bytes(out_low) == canonical_to_csv_bytes(out_str)
+    assert rep_low.rows_out == 5
+
+
+def test_low_memory_keeps_text_amounts_when_not_exact():
+    df = aggregate_df(
+        [
+            ("1234", "שופרסל", "01/09/2025", "10.125"),
+            ("1234", "רמי לוי", "02/09/2025", "100"),
+        ]
+    )
+    out_str, _, out_low, rep_low = _both_modes(df)
+
+    assert not pd.api.types.is_integer_dtype(out_low["amount"])
+    assert AMOUNT_DECIMALS_COL not in out_low.columns
+    assert any("Kept amounts as text" in w for w in rep_low.warnings)
+    assert canonical_to_csv_bytes(out_low) == canonical_to_csv_bytes(out_str)
+
+
+def test_low_memory_keeps_text_dates_when_not_iso():
+    # parse_date_to_iso's fallback turns "1.9.25" into "25-09-01", which
+    # datetime64 can't hold; the row must survive in both modes
+    df = aggregate_df(
+        [
+            ("1234", "שופרסל", "1.9.25", "100"),
+            ("1234", "רמי לוי", "02/09/2025", "10.5"),
+        ]
+    )
+    out_str, rep_str, out_low, rep_low = _both_modes(df)
+
+    assert not pd.api.types.is_datetime64_any_dtype(out_low["transaction_date"])
+    assert any("Kept dates as text" in w for w in rep_low.warnings)
+    assert rep_low.rows_out == rep_str.rows_out == 2
+    assert canonical_to_csv_bytes(out_low) == canonical_to_csv_bytes(out_str)
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [],  # header-only export
+        [("1234", "סה\"כ", "", "100"), ("1234", "", "01/09/2025", "5")],  # only footer/incomplete rows
+    ],
+    ids=["header-only", "nothing-kept"],
+)
+@pytest.mark.parametrize("low_memory", [False, True])
+def test_empty_result(rows, low_memory):
+    out, rep = convert_df(aggregate_df(rows), low_memory=low_memory)
+    assert rep.rows_out == 0
+    assert list(out.columns)[:4] == CANONICAL_COLS
+    assert canonical_to_csv_bytes(out) == "account_number,transaction_date,description,amount\n".encode("utf-8-sig")
+
+
+def test_extra_profile_columns_are_not_exported(monkeypatch):
+    from bank_csv_normalizer.profiles.israeli_cards_aggregate_v1 import IsraeliCardsAggregateV1
+
+    original = IsraeliCardsAggregateV1.iter_canonical
+
+    def reordered(self, df):
+        cols = dict(original(self, df))
+        yield "amount", cols.pop("amount")
+        yield "internal_ref", pd.Series("x", index=df.index)
+        yield from cols.items()
+
+    monkeypatch.setattr(IsraeliCardsAggregateV1, "iter_canonical", reordered)
+    df = aggregate_df([("1234", "שופרסל", "01/09/2025", "100")])
+    out_str, _, out_low, _ = _both_modes(df)
+    assert list(out_str.columns) == CANONICAL_COLS
+    assert list(out_low.columns) == CANONICAL_COLS + [AMOUNT_DECIMALS_COL]
+    assert canonical_to_csv_bytes(out_low) == canonical_to_csv_bytes(out_str)
+
+
+def test_low_memory_frame_is_several_times_smaller():
+    merchants = [f"בית עסק {i}" for i in range(50)]
+    rows = [
+        (str(1000 + i % 3), merchants[i % 50], f"{1 + i % 28:02d}/09/2025", f"{(i % 997) + 0.25:.2f}")
+        for i in range(5000)
+    ]
+    out_str, _, out_low, _ = _both_modes(aggregate_df(rows))
+
+    size_str = out_str.memory_usage(deep=True).sum()
+    size_low = out_low.memory_usage(deep=True).sum()
+    # ~13x with object strings (pandas 2), ~3.5x with Arrow strings (pandas 3)
+    assert size_low * 3 < size_str
+    assert canonical_to_csv_bytes(out_low) == canonical_to_csv_bytes(out_str)
+
+
+def test_format_minor_units_respects_decimals():
+    minor = pd.Series([10000, 1050, -1250, 5], dtype="int64")
+    decimals = pd.Series([0, 1, 2, 2], dtype="int8")
+    assert format_minor_units(minor, decimals).tolist() == ["100", "10.5", "-12.50", "0.05"]
+    assert format_minor_units(minor).tolist() == ["100.00", "10.50", "-12.50", "0.05"]
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+import os
+import pstats
+
+from bank_csv_normalizer import profiling
+from bank_csv_normalizer.normalize.dates import parse_date_to_iso
+from bank_csv_normalizer.normalize.io import load_csv_bytes
+from bank_csv_normalizer.profiling import profile_run, record_slow_path
+
+
+CSV = (
+    "Statement export\n"
+    "כרטיס,בית עסק,תאריך עסקה,סכום העסקה\n"
+    + "".join(f"1234,שופרסל,0{d}/09/2025,{d}0.00\n" for d in range(1, 6))
+).encode("utf-8")
+
+
+def test_profile_run_writes_dump_and_summary(tmp_path):
+    out = str(tmp_path / "run.prof")
+    with profile_run(out) as active:
+        assert active
+        load_csv_bytes(CSV)
+        parse_date_to_iso("2025-09-01")
+        parse_date_to_iso("32.13.2025")
+
+    pstats.Stats(out)  # a valid cProfile dump
+    with open(out + ".json", encoding="utf-8") as f:
+        summary = json.load(f)
+
+    paths = summary["slow_paths"]
+    assert paths["dates.format[%Y-%m-%d]"] == 1
+    assert paths["dates.fallback"] == 1
+    assert paths["dates.unparsed"] == 1
+    assert paths["header.lookahead_candidates"] >= 1
+    # Rows after each candidate header, counted in one call per candidate
+    assert paths["header.lookahead_rows"] >= 5
+    assert summary["slow_path_examples"]["dates.fallback"] == ["32.13.2025"]
+    assert any(r["package"] for r in summary["package_functions"])
+
+
+def test_unsampled_run_writes_nothing(tmp_path):
+    out = str(tmp_path / "run.prof")
+    with profile_run(out, sample_rate=0.0) as active:
+        assert not active
+        parse_date_to_iso("32.13.2025")
+    assert not os.path.exists(out)
+    assert not os.path.exists(out + ".json")
+
+
+def test_record_slow_path_outside_run_is_noop():
+    record_slow_path("anything", "value", count=3)
+    assert profiling._counters is None
+    with profile_run(None) as active:
+        assert not active
+    assert profiling._counters is None
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+
+import pandas as pd
+
+from bank_csv_normalizer.convert import canonical_to_csv_bytes, convert_df
+from bank_csv_normalizer.tests.helpers import aggregate_df
+
+
+DISCOUNT_HEADERS = ["תאריך עסקה", "שם בית עסק", "סכום עסקה", "סכום חיוב", "סוג עסקה"]
+
+
+def test_nan_amount_is_kept_but_not_summed():
+    # pandas 2.x astype(str) turns a blank Excel cell into "nan"
+    df = pd.DataFrame(
+        [
+            ["2025-11-30 00:00:00", "שופרסל", "20", "20", "רגילה"],
+            ["2025-11-30 00:00:00", "קפה", "nan", "nan", "רגילה"],
+        ],
+        columns=DISCOUNT_HEADERS,
+        dtype=str,
+    )
+    out_str, rep_str = convert_df(df)
+    out_low, rep_low = convert_df(df, low_memory=True)
+    assert canonical_to_csv_bytes(out_low) == canonical_to_csv_bytes(out_str)
+    for out, rep in ((out_str, rep_str), (out_low, rep_low)):
+        assert rep.profile == "discount_bank_visa_v1"
+        assert rep.rows_out == 2
+        assert rep.accounts[""].rows == 2
+        assert rep.accounts[""].total == "20"
+
+
+def test_summary_per_account_exact():
+    df = aggregate_df(
+        [
+            ("1234", "שופרסל", "03/09/2025", "10.125"),
+            ("1234", "פז", "01/09/2025", "100"),
+            ("5678", "קפה", "02/09/2025", "0.1"),
+            ("5678", "קפה", "05/09/2025", "0.2"),
+        ]
+    )
+    _, rep = convert_df(df)
+    assert rep.accounts["1234"].rows == 2
+    assert rep.accounts["1234"].total == "110.125"
+    assert rep.accounts["1234"].first_date == "2025-09-01"
+    assert rep.accounts["1234"].last_date == "2025-09-03"
+    assert rep.accounts["5678"].total == "0.3"
+
+
+def test_summary_identical_in_both_modes():
+    df = aggregate_df(
+        [
+            ("1234", "שופרסל", "03/09/2025", "100"),
+            ("1234", "פז", "01/09/2025", "10.5"),
+            ("5678", "קפה", "02/09/2025", "-0.25"),
+        ]
+    )
+    _, rep_str = convert_df(df)
+    _, rep_low = convert_df(df, low_memory=True)
+    assert asdict(rep_str)["accounts"] == asdict(rep_low)["accounts"]
+    assert rep_str.accounts["1234"].total == "110.5"
+
+
+def test_footer_reconciliation_is_exact():
+    rows = [
+        ("1234", "שופרסל", "01/09/2025", "10.125"),
+        ("1234", "פז", "02/09/2025", "100"),
+    ]
+    _, rep = convert_df(aggregate_df(rows + [("1234", "סה\"כ", "", "110.125")]))
+    assert [ft.matches for ft in rep.footer_totals] == [True]
+
+    _, rep = convert_df(aggregate_df(rows + [("1234", "סה\"כ", "", "110.124")]))
+    assert [ft.matches for ft in rep.footer_totals] == [False]
+    assert rep.footer_totals[0].computed == "110.125"
+    assert any("states 110.124" in w for w in rep.warnings)
+
+
+def test_footer_for_unknown_account_compares_to_zero():
+    rows = [
+        ("1234", "שופרסל", "01/09/2025", "30"),
+        ("9999", "סה\"כ", "", "30"),
+        ("", "סך הכל", "", "30"),
+    ]
+    _, rep = convert_df(aggregate_df(rows))
+    by_acc = {ft.account_number: ft for ft in rep.footer_totals}
+    assert by_acc["9999"].computed == "0"
+    assert not by_acc["9999"].matches
+    # No account on the footer row: grand total
+    assert by_acc[""].matches
+
+
+def test_trailing_rows_are_not_reconciled():
+    rows = [
+        ("1234", "שופרסל", "01/09/2025", "30"),
+        ("1234", "Pending auth - Cafe", "", "7"),
+    ]
+    _, rep = convert_df(aggregate_df(rows))
+    assert rep.footer_totals == []
+    assert not any("Footer total" in w for w in rep.warnings)
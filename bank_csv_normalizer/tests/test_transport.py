@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import io
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from bank_csv_normalizer import transport
+from bank_csv_normalizer.convert import canonical_to_csv_bytes, convert_df
+from bank_csv_normalizer.tests.helpers import aggregate_csv
+from bank_csv_normalizer.transport import SharedSegment, convert_paths, get_bytes, get_frame, put_bytes, put_frame
+
+
+CSV = aggregate_csv(
+    (str(1000 + i % 3), f"שופרסל {i % 7}", f"{1 + i % 28:02d}/09/2025", f"{i}.50") for i in range(200)
+)
+
+
+def _shm_segments() -> set:
+    return {n for n in os.listdir("/dev/shm") if n.startswith("bn")}
+
+
+def _segment_exists(name: str) -> bool:
+    try:
+        get_bytes(SharedSegment(name, 0))
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _canonical(low_memory: bool) -> pd.DataFrame:
+    df = pd.read_csv(io.BytesIO(CSV), dtype=str, keep_default_na=False)
+    return convert_df(df, low_memory=low_memory)[0]
+
+
+def test_bytes_round_trip():
+    seg = put_bytes(b"\xef\xbb\xbfa,b\n1,2\n")
+    try:
+        assert get_bytes(seg) == b"\xef\xbb\xbfa,b\n1,2\n"
+    finally:
+        transport.unlink_segment(seg.name)
+    assert not _segment_exists(seg.name)
+
+
+@pytest.mark.parametrize("low_memory", [False, True])
+def test_frame_round_trip_keeps_dtypes(low_memory):
+    df = _canonical(low_memory)
+    seg = put_frame(df)
+    out = get_frame(seg, unlink=True)
+
+    assert not _segment_exists(seg.name)
+    assert list(out.columns) == list(df.columns)
+    for col in df.columns:
+        if pd.api.types.is_string_dtype(df[col]) and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            # object or str, depending on the pandas version
+            assert pd.api.types.is_string_dtype(out[col])
+        else:
+            assert out[col].dtype == df[col].dtype, col
+    pd.testing.assert_frame_equal(out, df, check_dtype=False)
+    assert canonical_to_csv_bytes(out) == canonical_to_csv_bytes(df)
+
+
+def test_put_frame_falls_back_to_exact_size(monkeypatch):
+    df = _canonical(True)
+    monkeypatch.setattr(transport, "_stream_size_bound", lambda table: 16)
+    seg = put_frame(df)
+    pd.testing.assert_frame_equal(get_frame(seg, unlink=True), df)
+
+
+def _write_inputs(tmp_path, names):
+    paths = []
+    for name in names:
+        p = tmp_path / name
+        p.write_bytes(CSV)
+        paths.append(str(p))
+    return paths
+
+
+def test_convert_paths_matches_convert_df(tmp_path):
+    paths = _write_inputs(tmp_path, ("a.csv", "b.csv", "c.csv"))
+
+    results = list(convert_paths(paths, workers=2, low_memory=True))
+    expected = canonical_to_csv_bytes(_canonical(True))
+    assert sorted(r.path for r in results) == paths
+    for res in results:
+        assert res.error is None
+        assert res.report.rows_out == 200
+        assert canonical_to_csv_bytes(res.canonical) == expected
+
+
+_REAL_CONVERT_SEGMENT = transport._convert_segment
+
+
+def _fail_on_bad(input_seg, filename, result_name, low_memory, extra_total_markers):
+    if filename.startswith("bad"):
+        raise ValueError(f"cannot convert {filename}")
+    return _REAL_CONVERT_SEGMENT(input_seg, filename, result_name, low_memory, extra_total_markers)
+
+
+def _crash_on_bad(input_seg, filename, result_name, low_memory, extra_total_markers):
+    if filename.startswith("bad"):
+        # Worker dies after creating its result segment, before returning the handle
+        put_bytes(b"partial", name=result_name)
+        os._exit(1)
+    return _REAL_CONVERT_SEGMENT(input_seg, filename, result_name, low_memory, extra_total_markers)
+
+
+def test_convert_paths_reports_failures_per_file(tmp_path, monkeypatch):
+    paths = _write_inputs(tmp_path, ("a.csv", "bad.csv", "b.csv"))
+    missing = str(tmp_path / "missing.csv")
+
+    monkeypatch.setattr(transport, "_convert_segment", _fail_on_bad)
+    results = {r.path: r for r in convert_paths(paths + [missing], workers=2)}
+
+    assert isinstance(results[paths[1]].error, ValueError)
+    assert isinstance(results[missing].error, FileNotFoundError)
+    for p in (paths[0], paths[2]):
+        assert results[p].error is None
+        assert results[p].report.rows_out == 200
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="needs POSIX shared memory in /dev/shm")
+def test_worker_crash_only_fails_its_file(tmp_path, monkeypatch):
+    paths = _write_inputs(tmp_path, ("a.csv", "bad.csv", "b.csv", "c.csv"))
+    before = _shm_segments()
+
+    monkeypatch.setattr(transport, "_convert_segment", _crash_on_bad)
+    results = {r.path: r for r in convert_paths(paths, workers=2)}
+
+    assert sorted(results) == sorted(paths)
+    assert isinstance(results[paths[1]].error, BrokenProcessPool)
+    for p in paths[:1] + paths[2:]:
+        assert results[p].error is None, results[p].error
+        assert results[p].report.rows_out == 200
+    assert _shm_segments() == before
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="needs POSIX shared memory in /dev/shm")
+def test_segments_removed_when_iteration_stops_early(tmp_path):
+    paths = _write_inputs(tmp_path, ("a.csv", "b.csv", "c.csv"))
+    before = _shm_segments()
+
+    results = convert_paths(paths, workers=2)
+    assert next(results).error is None
+    results.close()
+
+    assert _shm_segments() == before
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+
+from bank_csv_normalizer import watch
+from bank_csv_normalizer.watch import INDEX_FILENAME, Watcher, output_paths
+
+
+SAMPLE_CSV = """כרטיס,בית עסק,תאריך עסקה,סכום העסקה,תאריך החיוב,סכום החיוב
+1234,שופרסל,01/09/2025,100.50,10/10/2025,100.50
+1234,פז,02/09/2025,50,10/10/2025,50
+"""
+
+
+def _drop(directory, name, text=SAMPLE_CSV, age=60):
+    path = os.path.join(directory, name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    past = time.time() - age
+    os.utime(path, (past, past))
+    return path
+
+
+# Captured at import so spawned workers (which re-import this module) see it too
+_REAL_CONVERT_ONE = watch._convert_one
+
+
+def _crash_on_name(input_path, *args):
+    """Worker stand-in: hard-exit the process for files named crash*."""
+    if os.path.basename(input_path).startswith("crash"):
+        os._exit(1)
+    return _REAL_CONVERT_ONE(input_path, *args)
+
+
+def _run(in_dir, out_dir, **kwargs):
+    results = []
+    w = Watcher(str(in_dir), str(out_dir), settle=0, workers=2,
+                on_result=lambda name, state: results.append((name, state)), **kwargs)
+    w.run(once=True)
+    return w, dict(results)
+
+
+def test_converts_once_and_resumes_from_index(tmp_path):
+    in_dir, out_dir = tmp_path / "in", tmp_path / "out"
+    in_dir.mkdir()
+    _drop(in_dir, "a.csv")
+
+    _, results = _run(in_dir, out_dir)
+    assert results["a.csv"].status == "done"
+    out_csv, out_rep = output_paths(str(out_dir), "a.csv")
+    assert os.path.exists(out_csv) and os.path.exists(out_rep)
+    with open(out_dir / INDEX_FILENAME, encoding="utf-8") as f:
+        assert json.load(f)["files"]["a.csv"]["status"] == "done"
+
+    # Restart: nothing to do
+    _, results = _run(in_dir, out_dir)
+    assert results == {}
+
+    # Changed file is converted again
+    _drop(in_dir, "a.csv", SAMPLE_CSV + "5678,קפה,03/09/2025,7,10/10/2025,7\n", age=30)
+    _, results = _run(in_dir, out_dir)
+    assert results["a.csv"].status == "done"
+
+
+def test_unsettled_files_wait(tmp_path):
+    in_dir, out_dir = tmp_path / "in", tmp_path / "out"
+    in_dir.mkdir()
+    _drop(in_dir, "fresh.csv", age=0)
+
+    w = Watcher(str(in_dir), str(out_dir), settle=30)
+    try:
+        assert w.poll_once() == 0
+    finally:
+        w.close()
+
+
+def test_output_paths_keep_extension(tmp_path):
+    assert output_paths(str(tmp_path), "a.csv") != output_paths(str(tmp_path), "a.xlsx")
+
+
+def test_worker_crash_retries_innocent_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(watch, "_convert_one", _crash_on_name)
+    in_dir, out_dir = tmp_path / "in", tmp_path / "out"
+    in_dir.mkdir()
+    for name in ("good1.csv", "crash.csv", "good2.csv"):
+        _drop(in_dir, name)
+
+    w, results = _run(in_dir, out_dir, max_crash_retries=2)
+
+    assert results["good1.csv"].status == "done"
+    assert results["good2.csv"].status == "done"
+    assert results["crash.csv"].status == "failed"
+    assert "crashed" in results["crash.csv"].error
+    # The daemon can keep going with a fresh pool
+    _drop(in_dir, "good3.csv")
+    w.poll_once()
+    w.close()
+    assert w.index.files["good3.csv"].status == "done"
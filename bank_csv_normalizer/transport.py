@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import ctypes
+import os
+import uuid
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Deque, Dict, Iterable, Iterator, Optional, Tuple
+
+import pandas as pd
+
+from bank_csv_normalizer.convert import convert_df
+from bank_csv_normalizer.normalize.io import load_bytes
+from bank_csv_normalizer.report import ConversionReport
+
+try:
+    import pyarrow as pa
+except ImportError:  # optional dependency: pip install bank-csv-normalizer[arrow]
+    pa = None
+
+
+@dataclass(frozen=True)
+class SharedSegment:
+    """Handle to a shared-memory segment; cheap to pickle between processes."""
+
+    name: str
+    size: int
+
+
+def _require_arrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "Shared-memory transport requires pyarrow: pip install 'bank-csv-normalizer[arrow]'"
+        )
+
+
+def new_segment_name() -> str:
+    # Short enough for macOS' 31-char POSIX shm name limit
+    return f"bn{os.getpid() % 100000}_{uuid.uuid4().hex[:16]}"
+
+
+def unlink_segment(name: str) -> None:
+    """Remove a segment by name; a no-op if it was never created or is already gone."""
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
+
+
+# ---------------------------------------------------------------------- #
+# Raw bytes                                                               #
+# ---------------------------------------------------------------------- #
+def put_bytes(data: bytes, name: Optional[str] = None) -> SharedSegment:
+    shm = shared_memory.SharedMemory(name=name or new_segment_name(), create=True, size=max(1, len(data)))
+    try:
+        shm.buf[: len(data)] = data
+        return SharedSegment(shm.name, len(data))
+    finally:
+        shm.close()
+
+
+def get_bytes(seg: SharedSegment) -> bytes:
+    shm = shared_memory.SharedMemory(name=seg.name)
+    try:
+        return bytes(shm.buf[: seg.size])
+    finally:
+        shm.close()
+
+
+# ---------------------------------------------------------------------- #
+# Frames as Arrow IPC streams                                             #
+# ---------------------------------------------------------------------- #
+# Per-message allowance for IPC framing and flatbuffer metadata, on top of
+# the padded buffers themselves
+_MESSAGE_SLACK = 1024
+_PER_BUFFER_SLACK = 64
+
+
+def _array_buffers(arr) -> list:
+    if pa.types.is_dictionary(arr.type):
+        return _array_buffers(arr.indices) + _array_buffers(arr.dictionary)
+    return arr.buffers()
+
+
+def _stream_size_bound(table) -> int:
+    """
+    Upper bound on the IPC stream size of ``table``, from its buffer sizes
+    alone: every buffer padded to 64 bytes, plus schema and message metadata.
+    """
+    buffers = [b for col in table.columns for chunk in col.chunks for b in _array_buffers(chunk)]
+    data = sum(b.size for b in buffers if b is not None) + len(buffers) * _PER_BUFFER_SLACK
+    # Schema, one dictionary batch per column at most, record batches, EOS
+    messages = 2 + table.num_columns + max(1, table.column(0).num_chunks if table.num_columns else 1)
+    return table.schema.serialize().size + data + messages * _MESSAGE_SLACK
+
+
+def _write_stream(table, mem: memoryview) -> Optional[int]:
+    """Stream ``table`` into ``mem``; the bytes written, or None if it didn't fit."""
+    # Kept in its own frame, overflow included, so every Arrow view of ``mem``
+    # is released on return; SharedMemory.close() fails while any export is
+    # alive, and a propagating traceback would keep the writer alive.
+    sink = pa.FixedSizeBufferWriter(pa.py_buffer(mem))
+    size = None
+    try:
+        with pa.ipc.new_stream(sink, table.schema) as w:
+            w.write_table(table)
+        size = sink.tell()
+    except OSError:  # pa.ArrowIOError: "Write out of bounds"
+        pass
+    finally:
+        sink.close()
+    return size
+
+
+def _exact_stream_size(table) -> int:
+    sizer = pa.MockOutputStream()
+    with pa.ipc.new_stream(sizer, table.schema) as w:
+        w.write_table(table)
+    return sizer.size()
+
+
+def _put_table(table, name: str, capacity: int) -> Optional[SharedSegment]:
+    shm = shared_memory.SharedMemory(name=name, create=True, size=max(1, capacity))
+    size = None
+    try:
+        size = _write_stream(table, shm.buf)
+    finally:
+        shm.close()
+        if size is None:
+            shm.unlink()
+    return SharedSegment(name, size) if size is not None else None
+
+
+def put_frame(df: pd.DataFrame, name: Optional[str] = None) -> SharedSegment:
+    """
+    Write ``df`` as one Arrow IPC stream into a new segment. Categoricals travel
+    as dictionary arrays, so low-memory frames stay compact on the wire.
+
+    The segment is sized from an upper bound, so the table is serialized once;
+    unused tail pages of the segment are never touched. Should the bound ever
+    fall short, the stream is sized exactly and written again.
+    """
+    _require_arrow()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    name = name or new_segment_name()
+    seg = _put_table(table, name, _stream_size_bound(table))
+    if seg is None:
+        seg = _put_table(table, name, _exact_stream_size(table))
+    return seg
+
+
+def _buffer_address(mem: memoryview) -> int:
+    # The ctypes view is dropped on return, so it doesn't pin ``mem``
+    return ctypes.addressof(ctypes.c_char.from_buffer(mem))
+
+
+def get_frame(seg: SharedSegment, unlink: bool = False) -> pd.DataFrame:
+    """
+    Read a frame written by ``put_frame`` without copying the stream: Arrow
+    reads straight from the mapping, which stays alive for as long as any
+    column still refers to it. With ``unlink`` the segment's name is removed
+    as soon as it is attached; the memory is freed once the frame is gone.
+    """
+    _require_arrow()
+    shm = shared_memory.SharedMemory(name=seg.name)
+    if unlink:
+        shm.unlink()
+    # ``base`` keeps ``shm`` (and so the mapping) referenced by the buffer
+    buf = pa.foreign_buffer(_buffer_address(shm.buf), seg.size, base=shm)
+    return pa.ipc.open_stream(buf).read_all().to_pandas()
+
+
+# ---------------------------------------------------------------------- #
+# Pooled conversion                                                       #
+# ---------------------------------------------------------------------- #
+def _convert_segment(
+    input_seg: SharedSegment,
+    filename: str,
+    result_name: str,
+    low_memory: bool,
+    extra_total_markers: Tuple[str, ...],
+) -> Tuple[SharedSegment, ConversionReport]:
+    """Worker entry point: input bytes in, canonical frame out, both via shared memory."""
+    load_res = load_bytes(get_bytes(input_seg), filename)
+    canonical, rep = convert_df(load_res.df, low_memory=low_memory, extra_total_markers=extra_total_markers)
+    return put_frame(canonical, name=result_name), rep
+
+
+@dataclass
+class BatchResult:
+    """Outcome for one input of ``convert_paths``: frame and report, or the error."""
+
+    path: str
+    canonical: Optional[pd.DataFrame] = None
+    report: Optional[ConversionReport] = None
+    error: Optional[BaseException] = None
+
+
+class _Pool:
+    """
+    Process pool plus the shared-memory segments of the files in flight. The
+    parent owns every segment name (result names are chosen before
+    submission), so all of them can be unlinked even if a worker dies.
+    """
+
+    def __init__(self, workers: Optional[int], low_memory: bool, extra_total_markers: Tuple[str, ...]):
+        self.workers = workers
+        self.limit = workers or os.cpu_count() or 1
+        self.args = (low_memory, extra_total_markers)
+        self.executor: Optional[ProcessPoolExecutor] = None
+        # future -> (path, input segment, result segment, ran alone)
+        self.running: Dict[Future, Tuple[str, str, str, bool]] = {}
+
+    def discard_executor(self) -> None:
+        if self.executor is not None:
+            # Not cancel_futures: queued work of a broken pool fails with
+            # BrokenProcessPool, which marks it for a solo retry
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    def submit(self, path: str, alone: bool = False) -> None:
+        with open(path, "rb") as f:
+            seg = put_bytes(f.read())
+        result_name = new_segment_name()
+        try:
+            for attempt in range(2):
+                if self.executor is None:
+                    self.executor = ProcessPoolExecutor(max_workers=self.workers)
+                try:
+                    fut = self.executor.submit(
+                        _convert_segment, seg, os.path.basename(path), result_name, *self.args
+                    )
+                    break
+                except BrokenProcessPool:
+                    # Broke since the last collect; start a fresh pool once
+                    self.discard_executor()
+                    if attempt:
+                        raise
+        except BaseException:
+            unlink_segment(seg.name)
+            raise
+        self.running[fut] = (path, seg.name, result_name, alone)
+
+    def release(self, fut: Future) -> Tuple[str, str, bool]:
+        """Forget ``fut`` and free its input; returns (path, result name, ran alone)."""
+        path, input_name, result_name, alone = self.running.pop(fut)
+        unlink_segment(input_name)
+        return path, result_name, alone
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+        for _path, input_name, result_name, _alone in self.running.values():
+            unlink_segment(input_name)
+            unlink_segment(result_name)
+        self.running.clear()
+
+
+def _crashed(fut: Future) -> bool:
+    return fut.cancelled() or isinstance(fut.exception(), BrokenProcessPool)
+
+
+def convert_paths(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    low_memory: bool = False,
+    extra_total_markers: Iterable[str] = (),
+) -> Iterator[BatchResult]:
+    """
+    Convert several files in a process pool, yielding one ``BatchResult`` per
+    input as soon as it finishes (completion order). Inputs and canonical
+    frames cross the process boundary in shared memory; only segment handles
+    and reports are pickled.
+
+    At most ``workers`` files are in flight: an input is copied into shared
+    memory when it is submitted and each frame is handed over as it arrives,
+    so memory doesn't grow with the size of the batch.
+
+    A file that fails yields its error without stopping the others. A crashed
+    worker takes down the whole pool; the files that were in flight are then
+    retried one at a time, so only a file that crashes on its own is reported
+    (with ``BrokenProcessPool``). Segments are unlinked even if the caller
+    stops iterating early.
+    """
+    _require_arrow()
+    pool = _Pool(workers, low_memory, tuple(extra_total_markers))
+    pending = deque(paths)
+    suspects: Deque[str] = deque()
+    try:
+        while pending or suspects or pool.running:
+            # Crash suspects wait for the pool to drain, then run alone
+            while suspects and not pool.running:
+                path = suspects.popleft()
+                try:
+                    pool.submit(path, alone=True)
+                except Exception as e:
+                    yield BatchResult(path, error=e)
+            while pending and not suspects and len(pool.running) < pool.limit:
+                path = pending.popleft()
+                try:
+                    pool.submit(path)
+                except Exception as e:
+                    yield BatchResult(path, error=e)
+            if not pool.running:
+                continue
+
+            done, _ = wait(list(pool.running), return_when=FIRST_COMPLETED)
+            if any(_crashed(f) for f in done):
+                pool.discard_executor()
+            for fut in done:
+                path, result_name, alone = pool.release(fut)
+                try:
+                    if _crashed(fut) and not alone:
+                        suspects.append(path)
+                        continue
+                    if fut.exception() is not None:
+                        yield BatchResult(path, error=fut.exception())
+                        continue
+                    seg, rep = fut.result()
+                    try:
+                        canonical = get_frame(seg, unlink=True)
+                    except Exception as e:
+                        yield BatchResult(path, error=e)
+                        continue
+                    yield BatchResult(path, canonical=canonical, report=rep)
+                    del canonical
+                finally:
+                    unlink_segment(result_name)
+    finally:
+        pool.close()
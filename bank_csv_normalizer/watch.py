@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from bank_csv_normalizer.convert import convert
+from bank_csv_normalizer.report import ConversionReport
+
+
+INDEX_FILENAME = ".banknorm-watch.json"
+INPUT_SUFFIXES = (".csv", ".xlsx", ".xls")
+
+
+@dataclass
+class FileState:
+    size: int
+    mtime_ns: int
+    status: str  # "done" | "failed"
+    output: str = ""
+    report: str = ""
+    error: str = ""
+
+
+def output_paths(out_dir: str, name: str) -> Tuple[str, str]:
+    """Canonical CSV and report paths for input ``name``; the extension is kept
+    so "a.csv" and "a.xlsx" don't overwrite each other."""
+    return (
+        os.path.join(out_dir, f"{name}.canonical.csv"),
+        os.path.join(out_dir, f"{name}.report.json"),
+    )
+
+
+def _fsync_file(path: str) -> None:
+    with open(path, "rb") as f:
+        os.fsync(f.fileno())
+
+
+def _atomic_write_text(path: str, text: str) -> None:
+    tmp = f"{path}.tmp-{os.getpid()}"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class WatchIndex:
+    """
+    Stat-based change index (name -> size/mtime/status), persisted as JSON.
+    A file is up to date when its current size and mtime match the entry,
+    whether the last attempt succeeded or failed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.files: Dict[str, FileState] = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            self.files = {name: FileState(**st) for name, st in raw.get("files", {}).items()}
+
+    def is_current(self, name: str, st: os.stat_result) -> bool:
+        fs = self.files.get(name)
+        return fs is not None and fs.size == st.st_size and fs.mtime_ns == st.st_mtime_ns
+
+    def record(self, name: str, state: FileState) -> None:
+        self.files[name] = state
+
+    def save(self) -> None:
+        data = {"files": {name: asdict(st) for name, st in sorted(self.files.items())}}
+        _atomic_write_text(self.path, json.dumps(data, ensure_ascii=False, indent=2))
+
+
+def _convert_one(
+    input_path: str,
+    output_path: str,
+    report_path: str,
+    low_memory: bool,
+    extra_total_markers: Tuple[str, ...],
+) -> ConversionReport:
+    """
+    Worker entry point: convert into temp files next to the targets, then
+    rename them into place so readers never see a half-written output.
+    """
+    suffix = f".tmp-{os.getpid()}"
+    tmp_out, tmp_rep = output_path + suffix, report_path + suffix
+    try:
+        rep = convert(
+            input_path,
+            tmp_out,
+            tmp_rep,
+            low_memory=low_memory,
+            extra_total_markers=extra_total_markers,
+        )
+        _fsync_file(tmp_out)
+        _fsync_file(tmp_rep)
+        os.replace(tmp_out, output_path)
+        os.replace(tmp_rep, report_path)
+        return rep
+    finally:
+        for p in (tmp_out, tmp_rep):
+            if os.path.exists(p):
+                os.remove(p)
+
+
+class Watcher:
+    """
+    Polls ``watch_dir`` and converts new or changed exports into ``out_dir``.
+
+    - A file is picked up once its mtime is at least ``settle`` seconds old,
+      which debounces bursts of writes to the same file.
+    - The directory listing is only re-read when the directory mtime changes
+      (files added/removed/renamed), when files are waiting to settle, or every
+      ``full_scan_every`` polls to catch files rewritten in place.
+    - Every finished file is checkpointed to the index in ``out_dir``, so a
+      restart resumes without reconverting finished files.
+    - A crashed worker takes down the whole pool; the pool is recreated and
+      the files that were in flight are retried one at a time, so only the
+      file that actually crashes is recorded as failed, after
+      ``max_crash_retries`` solo crashes.
+    """
+
+    def __init__(
+        self,
+        watch_dir: str,
+        out_dir: str,
+        interval: float = 2.0,
+        settle: float = 2.0,
+        workers: Optional[int] = None,
+        low_memory: bool = False,
+        extra_total_markers: Iterable[str] = (),
+        full_scan_every: int = 30,
+        max_crash_retries: int = 3,
+        on_result: Optional[Callable[[str, FileState], None]] = None,
+    ):
+        if os.path.abspath(watch_dir) == os.path.abspath(out_dir):
+            raise ValueError("out_dir must differ from watch_dir, or outputs would be picked up as inputs.")
+        self.watch_dir = watch_dir
+        self.out_dir = out_dir
+        self.interval = interval
+        self.settle = settle
+        self.workers = workers
+        self.low_memory = low_memory
+        self.extra_total_markers = tuple(extra_total_markers)
+        self.full_scan_every = max(1, full_scan_every)
+        self.max_crash_retries = max(1, max_crash_retries)
+        self.on_result = on_result
+
+        os.makedirs(out_dir, exist_ok=True)
+        self.index = WatchIndex(os.path.join(out_dir, INDEX_FILENAME))
+
+        self._dir_mtime_ns: Optional[int] = None
+        self._polls = 0
+        self._unsettled: Dict[str, os.stat_result] = {}
+        self._inflight: Dict[Future, Tuple[str, os.stat_result]] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Files in flight when a worker crashed: run alone until they finish
+        self._isolate: Set[str] = set()
+        self._crashes: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------ #
+    # Scanning                                                            #
+    # ------------------------------------------------------------------ #
+    def _output_paths(self, name: str) -> Tuple[str, str]:
+        return output_paths(self.out_dir, name)
+
+    def _scan(self) -> List[Tuple[str, os.stat_result]]:
+        """Return (name, stat) for input files that may need work."""
+        st_dir = os.stat(self.watch_dir)
+        self._polls += 1
+        full = (
+            st_dir.st_mtime_ns != self._dir_mtime_ns
+            or self._polls % self.full_scan_every == 0
+        )
+        self._dir_mtime_ns = st_dir.st_mtime_ns
+
+        if full:
+            found = []
+            with os.scandir(self.watch_dir) as it:
+                for entry in it:
+                    if entry.name.startswith(".") or not entry.name.lower().endswith(INPUT_SUFFIXES):
+                        continue
+                    if entry.is_file():
+                        found.append((entry.name, entry.stat()))
+            return found
+
+        # Cheap path: only re-stat files still waiting to settle
+        found = []
+        for name in list(self._unsettled):
+            try:
+                found.append((name, os.stat(os.path.join(self.watch_dir, name))))
+            except FileNotFoundError:
+                self._unsettled.pop(name, None)
+                self._isolate.discard(name)
+        return found
+
+    def _ready(self) -> List[Tuple[str, os.stat_result]]:
+        busy = {name for name, _ in self._inflight.values()}
+        now_ns = time.time_ns()
+        ready = []
+        for name, st in self._scan():
+            if name in busy:
+                # Re-check after it finishes in case it changed meanwhile
+                self._unsettled[name] = st
+                continue
+            if self.index.is_current(name, st):
+                self._unsettled.pop(name, None)
+                continue
+            if now_ns - st.st_mtime_ns < self.settle * 1e9:
+                self._unsettled[name] = st
+                continue
+            self._unsettled.pop(name, None)
+            ready.append((name, st))
+        return ready
+
+    # ------------------------------------------------------------------ #
+    # Work                                                                #
+    # ------------------------------------------------------------------ #
+    def _discard_executor(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _submit(self, name: str, st: os.stat_result) -> None:
+        out_path, rep_path = self._output_paths(name)
+        args = (
+            _convert_one,
+            os.path.join(self.watch_dir, name),
+            out_path,
+            rep_path,
+            self.low_memory,
+            self.extra_total_markers,
+        )
+        for attempt in range(2):
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            try:
+                fut = self._executor.submit(*args)
+                break
+            except BrokenProcessPool:
+                # Broke since the last collect; start a fresh pool once
+                self._discard_executor()
+                if attempt:
+                    raise
+        self._inflight[fut] = (name, st)
+
+    def _finish(self, name: str, state: FileState) -> None:
+        self._isolate.discard(name)
+        self._crashes.pop(name, None)
+        self.index.record(name, state)
+        if self.on_result is not None:
+            self.on_result(name, state)
+
+    def _collect(self, timeout: Optional[float]) -> int:
+        if not self._inflight:
+            return 0
+        done, _ = wait(list(self._inflight), timeout=timeout, return_when=FIRST_COMPLETED)
+        # A crash fails every future of the pool at once, so they share a batch
+        crashed = [f for f in done if isinstance(f.exception(), BrokenProcessPool)]
+        alone = len(crashed) == 1 and len(self._inflight) == 1
+        if crashed:
+            self._discard_executor()
+        recorded = False
+        for fut in done:
+            name, st = self._inflight.pop(fut)
+            out_path, rep_path = self._output_paths(name)
+            if fut in crashed:
+                if alone:
+                    self._crashes[name] = self._crashes.get(name, 0) + 1
+                if self._crashes.get(name, 0) < self.max_crash_retries:
+                    # Not recorded: it is retried, alone, on the next poll
+                    self._isolate.add(name)
+                    self._unsettled[name] = st
+                    continue
+                err = f"worker crashed {self._crashes[name]} times converting this file"
+                state = FileState(st.st_size, st.st_mtime_ns, "failed", error=err)
+            else:
+                try:
+                    fut.result()
+                    state = FileState(st.st_size, st.st_mtime_ns, "done", output=out_path, report=rep_path)
+                except Exception as e:
+                    state = FileState(st.st_size, st.st_mtime_ns, "failed", error=f"{type(e).__name__}: {e}")
+            self._finish(name, state)
+            recorded = True
+        if recorded:
+            # Checkpoint after each batch of completions
+            self.index.save()
+        return len(done)
+
+    def poll_once(self) -> int:
+        """Collect finished work, then submit whatever is ready. Returns submissions."""
+        self._collect(timeout=0)
+        submitted = 0
+        for name, st in self._ready():
+            if self._isolate & {n for n, _ in self._inflight.values()}:
+                # A crash suspect is running alone; everything else waits
+                self._unsettled[name] = st
+                continue
+            if name in self._isolate and self._inflight:
+                self._unsettled[name] = st
+                continue
+            self._submit(name, st)
+            submitted += 1
+        return submitted
+
+    def drain(self) -> None:
+        while self._inflight:
+            self._collect(timeout=None)
+
+    def close(self) -> None:
+        self.drain()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def run(self, once: bool = False) -> None:
+        try:
+            self.poll_once()
+            if once:
+                # Finish what was started, including solo retries after a crash
+                self.drain()
+                while self._isolate and self.poll_once():
+                    self.drain()
+                return
+            while True:
+                # Sleep by waiting on in-flight work, so completions are
+                # checkpointed promptly and an idle loop costs one stat() per tick.
+                deadline = time.monotonic() + self.interval
+                while self._inflight and time.monotonic() < deadline:
+                    self._collect(timeout=max(0.0, deadline - time.monotonic()))
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+                self.poll_once()
+        finally:
+            self.close()